@@ -2,10 +2,12 @@ from __future__ import annotations
 
 import inspect
 import logging
+import sys
 import threading
 import typing
 from dataclasses import dataclass
 from enum import Enum
+from types import FunctionType
 from typing import (
     TYPE_CHECKING,
     Any,
@@ -16,12 +18,14 @@ from typing import (
     get_type_hints,
     overload,
 )
+from weakref import WeakKeyDictionary, WeakSet, finalize, ref
 
 
 logger = logging.getLogger(__name__)
 
 if TYPE_CHECKING:
-    from collections.abc import Callable, Mapping
+    from collections.abc import Callable, Iterable
+    from typing import Self
 
     T = TypeVar("T")
     # Parameter spec for factories
@@ -35,18 +39,221 @@ class Lifetime(Enum):
     TRANSIENT = "transient"
 
 
-@dataclass
+@dataclass(slots=True)
 class Registration:
-    factory: Callable[..., object] | None
-    impl: type | None
-    lifetime: Lifetime
+    # Hot fields first: the resolve fast path only reads these two.
     cached_instance: object | None = None  # cached singleton
+    is_cached_singleton: bool = False
+    lifetime: Lifetime = Lifetime.SINGLETON
+    # Plain-bool mirror of the lifetime, set at construction: the per-resolve
+    # branch is one truthiness test instead of enum comparison machinery.
+    is_singleton: bool = True
+    factory: Callable[..., object] | None = None
+    impl: type | None = None
+    # Bound at register time so resolve makes one call instead of branching on
+    # factory vs impl; None for instance registrations (served from the cache).
+    create: Callable[[Container, dict[str, Any]], object] | None = None
 
 
 class ResolutionError(RuntimeError):
     pass
 
 
+# Shared read-only empty dict: never mutate.
+_EMPTY_DICT: dict[str, Any] = {}
+
+# Sentinel distinguishing "absent" from legitimately-None cache values.
+_MISS = object()
+
+# Capability token proving a Scope is being built by Container.create_scope;
+# forgeable only from inside this module.
+_SCOPE_TOKEN = object()
+
+
+class _NullLock:
+    """No-op context-manager lock for the default single-threaded configuration."""
+
+    __slots__ = ()
+
+    def __enter__(self) -> Self:
+        return self
+
+    def __exit__(self, *exc: object) -> None:
+        return None
+
+
+_NULL_LOCK = _NullLock()
+
+# Keyword arguments accepted by register(); register_many checks specs against
+# this set so a typo fails loudly instead of being silently dropped.
+_REGISTER_SPEC_KEYS = frozenset({"impl", "factory", "lifetime"})
+
+# Pre-resolved attribute loads for the hot paths: a module-level name is one
+# LOAD_GLOBAL instead of a chain of LOAD_ATTRs.
+_EMPTY = inspect.Parameter.empty  # same sentinel as inspect.Signature.empty
+_PROTOCOL_BASE: type = cast("type", Protocol)
+
+# Structural-conformance verdicts per (protocol, impl): None means conforming,
+# a TypeError holds the original failure. Weak keys let classes be GC'd normally.
+_STRUCTURAL_CACHE: WeakKeyDictionary[type, WeakKeyDictionary[type, TypeError | None]] = WeakKeyDictionary()
+
+# Runtime-checkable isinstance verdicts per (protocol, impl type). Protocol
+# membership is treated as invariant for a class, so the _ProtocolMeta attribute
+# walk runs once per pair; weak keys let either class be GC'd normally.
+_RUNTIME_ISINSTANCE_CACHE: WeakKeyDictionary[type, WeakKeyDictionary[type, bool]] = WeakKeyDictionary()
+
+
+# issubclass walks the MRO; repeat validation of the same (base, impl) pair
+# reduces to one probe. Same two-level weak shape as the caches above.
+_SUBCLASS_CACHE: WeakKeyDictionary[type, WeakKeyDictionary[type, bool]] = WeakKeyDictionary()
+
+
+def _is_subclass(impl: type, base: type) -> bool:
+    per_base = _SUBCLASS_CACHE.get(base)
+    if per_base is None:
+        per_base = _SUBCLASS_CACHE[base] = WeakKeyDictionary()
+    else:
+        ok = per_base.get(impl)
+        if ok is not None:
+            return ok
+    ok = issubclass(impl, base)
+    per_base[impl] = ok
+    return ok
+
+
+# Attribute names each protocol demands, computed once per protocol. The empty
+# tuple doubles as "unknown" (fall back to isinstance); real protocols always
+# have at least one member.
+_PROTO_ATTRS: WeakKeyDictionary[type, tuple[str, ...]] = WeakKeyDictionary()
+
+
+def _proto_attr_names(proto_cls: type) -> tuple[str, ...]:
+    names = _PROTO_ATTRS.get(proto_cls)
+    if names is None:
+        # 3.12+ precomputes the set; older versions expose the same walk as
+        # typing._get_protocol_attrs (the function isinstance itself uses).
+        attrs = getattr(proto_cls, "__protocol_attrs__", None)
+        if attrs is None:
+            getter = getattr(typing, "_get_protocol_attrs", None)
+            attrs = getter(proto_cls) if getter is not None else ()
+        names = _PROTO_ATTRS[proto_cls] = tuple(attrs)
+    return names
+
+
+# Generated presence checkers, one per runtime-checkable protocol: a chain of
+# hasattr tests compiled to straight-line bytecode (same approach as the
+# per-class constructor resolvers). None means "fall back to isinstance".
+_RUNTIME_CHECKERS: WeakKeyDictionary[type, Callable[[object], bool] | None] = WeakKeyDictionary()
+
+
+def _compile_runtime_check(proto_cls: type) -> Callable[[object], bool] | None:
+    names = _proto_attr_names(proto_cls)
+    if not names:
+        return None
+    body = " and ".join(f"_hasattr(obj, {name!r})" for name in names)
+    ns: dict[str, Any] = {}
+    exec(f"def _check(obj, _hasattr=hasattr):\n    return {body}", ns)  # noqa: S102
+    return cast("Callable[[object], bool]", ns["_check"])
+
+
+def _runtime_isinstance(instance: object, proto_cls: type) -> bool:
+    impl = type(instance)
+    per_proto = _RUNTIME_ISINSTANCE_CACHE.get(proto_cls)
+    if per_proto is None:
+        per_proto = _RUNTIME_ISINSTANCE_CACHE[proto_cls] = WeakKeyDictionary()
+    else:
+        ok = per_proto.get(impl)
+        if ok is not None:
+            return ok
+    if proto_cls in _RUNTIME_CHECKERS:
+        checker = _RUNTIME_CHECKERS[proto_cls]
+    else:
+        checker = _RUNTIME_CHECKERS[proto_cls] = _compile_runtime_check(proto_cls)
+    ok = checker(instance) if checker is not None else isinstance(instance, proto_cls)
+    per_proto[impl] = ok
+    return ok
+
+# Protocol-side reflection computed once per protocol: method signatures (an
+# Exception when the signature could not be derived), required positional
+# arities, and the attribute names required by annotations.
+_PROTO_METHODS: WeakKeyDictionary[
+    type,
+    tuple[dict[str, inspect.Signature | Exception], dict[str, int], tuple[str, ...]],
+] = WeakKeyDictionary()
+
+
+# Impl-side method shape, cached on the function: (required positional arity
+# excluding self, return annotation or _EMPTY). inspect.signature would build
+# the full Parameter graph for the same two facts.
+_IMPL_SHAPE_CACHE: WeakKeyDictionary[FunctionType, tuple[int, Any]] = WeakKeyDictionary()
+
+
+def _impl_callable_shape(fn: object) -> tuple[int, Any] | None:
+    """Read an impl method's shape off its code object.
+
+    Returns None for anything but a plain unwrapped Python function
+    (bound/classmethods, C callables, partials, wraps-decorated methods);
+    callers fall back to inspect.signature.
+    """
+    if type(fn) is not FunctionType or hasattr(fn, "__wrapped__"):
+        # Wrapped functions (functools.wraps) expose the wrapper's code object;
+        # the signature fallback follows __wrapped__ to the real shape.
+        return None
+    shape = _IMPL_SHAPE_CACHE.get(fn)
+    if shape is None:
+        code = fn.__code__
+        required = code.co_argcount - len(fn.__defaults__ or ())
+        if required > 0 and code.co_varnames[0] == "self":
+            required -= 1
+        shape = _IMPL_SHAPE_CACHE[fn] = (required, fn.__annotations__.get("return", _EMPTY))
+    return shape
+
+
+def _positional_arity(params: list[inspect.Parameter]) -> int:
+    return sum(
+        1
+        for p in params
+        if p.kind
+        in (
+            inspect.Parameter.POSITIONAL_ONLY,
+            inspect.Parameter.POSITIONAL_OR_KEYWORD,
+        )
+        and p.default is _EMPTY
+    )
+
+
+def _get_proto_methods(
+    proto_cls: type,
+) -> tuple[dict[str, inspect.Signature | Exception], dict[str, int], tuple[str, ...]]:
+    cached = _PROTO_METHODS.get(proto_cls)
+    if cached is not None:
+        return cached
+
+    try:
+        proto_hints = get_type_hints(proto_cls, include_extras=True)
+    except TypeError:
+        proto_hints = {}
+
+    annotation_members = tuple(name for name in proto_hints if not name.startswith("_"))
+
+    sigs: dict[str, inspect.Signature | Exception] = {}
+    arities: dict[str, int] = {}
+    for name, proto_attr in proto_cls.__dict__.items():
+        if name.startswith("_") or not inspect.isfunction(proto_attr):
+            continue
+        try:
+            sig = inspect.signature(proto_attr)
+        except Exception as e:  # noqa: BLE001
+            sigs[name] = e
+            continue
+        sigs[name] = sig
+        arities[name] = _positional_arity([p for p in sig.parameters.values() if p.name != "self"])
+
+    result = (sigs, arities, annotation_members)
+    _PROTO_METHODS[proto_cls] = result
+    return result
+
+
 class Container:
     """Minimal DI container.
 
@@ -56,9 +263,30 @@ class Container:
     - optional scoping.
     """
 
+    # Slots keep registry-heavy containers compact and make attribute loads in
+    # the hot resolve path a fixed-offset read; __weakref__ stays so scopes can
+    # sit in their parent's _children WeakSet.
+    __slots__ = ("__weakref__", "_by_name", "_by_type", "_children", "_construct", "_lock", "_singletons")
+
     def __init__(self) -> None:
-        self._registrations: dict[Any, Registration] = {}
-        self._lock = threading.RLock()
+        # Separate dicts per token kind: `type(token) is str` is one pointer
+        # compare, cheaper than inspect.isclass, and each dict stays homogeneous.
+        self._by_type: dict[Any, Registration] = {}
+        self._by_name: dict[str, Registration] = {}
+        # Flat singleton cache: the resolve fast path is one probe here, no
+        # Registration attribute reads at all.
+        self._singletons: dict[Any, object] = {}
+        # Lock guarding registration/cache writes only; resolution never holds
+        # it, so recursive resolves cannot deadlock. Containers start with a
+        # no-op lock (the common single-threaded case pays no acquire/release);
+        # enable_threadsafe() swaps in a real one.
+        self._lock: _NullLock | threading.Lock = _NULL_LOCK
+        # Bound method, not a delegating def: one call frame per construct, and
+        # a LOAD_ATTR on self instead of two.
+        self._construct: Callable[..., Any] = Constructor(self).construct
+        # Scopes created from this container; their flattened-chain caches are
+        # invalidated when a registration lands here.
+        self._children: WeakSet[Scope] = WeakSet()
 
     @overload
     def register(
@@ -105,6 +333,59 @@ class Container:
           container.register("db", factory=create_db, lifetime=Lifetime.SINGLETON)
 
         """
+        token, reg = self._prepare_registration(token, impl, factory, lifetime)
+
+        with self._lock:
+            self._store(token, reg)
+            # Re-registering drops any singleton cached for the old registration.
+            self._singletons.pop(token, None)
+            self._invalidate_descendants()
+
+    def register_many(self, specs: Iterable[tuple[Token[Any], dict[str, Any]]]) -> None:
+        """Register several bindings in one pass.
+
+        Each spec is ``(token, kwargs)`` with the same keyword arguments as
+        :meth:`register`; semantics match N individual calls, but validation
+        runs up front, the lock is taken once, and descendant scope caches are
+        invalidated in a single sweep. A spec key that :meth:`register` does
+        not accept raises ValueError before anything is stored.
+
+        Example:
+          container.register_many([
+              (IFoo, {"impl": FooImpl}),
+              ("db", {"factory": create_db, "lifetime": Lifetime.TRANSIENT}),
+          ])
+
+        """
+        prepared = []
+        for token, spec in specs:
+            unknown = spec.keys() - _REGISTER_SPEC_KEYS
+            if unknown:
+                msg = f"Unknown keys in spec for token {token!r}: {sorted(unknown)}"
+                raise ValueError(msg)
+            prepared.append(
+                self._prepare_registration(
+                    token,
+                    spec.get("impl"),
+                    spec.get("factory"),
+                    spec.get("lifetime", Lifetime.SINGLETON),
+                )
+            )
+
+        with self._lock:
+            for token, reg in prepared:
+                self._store(token, reg)
+                self._singletons.pop(token, None)
+            self._invalidate_descendants()
+
+    def _prepare_registration(
+        self,
+        token: Token[T],
+        impl: type | None,
+        factory: Callable[..., Any] | None,
+        lifetime: Lifetime,
+    ) -> tuple[Any, Registration]:
+        """Validate one binding and build its Registration; no container mutation."""
         if impl is not None and factory is not None:
             msg = "Provide either `impl` or `factory`, not both."
             raise ValueError(msg)
@@ -115,11 +396,30 @@ class Container:
 
         if impl is not None:  # noqa: SIM102
             # Only validate type tokens. Non-type tokens (like strings) cannot validate statically.
-            if inspect.isclass(token):
+            if isinstance(token, type):
                 self._validate_impl(cls=token, impl=impl)
 
-        with self._lock:
-            self._registrations[token] = Registration(factory=factory, impl=impl, lifetime=lifetime)
+        if type(token) is str:
+            # Interned keys let name lookups short-circuit on pointer identity.
+            token = sys.intern(token)
+
+        if factory is not None:
+            def create(c: Container, ov: dict[str, Any], _target: Any = factory) -> object:
+                # Most resolves pass no overrides; skip the ** unpack entirely.
+                return _target(c) if not ov else _target(c, **ov)
+        else:
+            impl_cls = cast("type", impl)
+
+            def create(c: Container, ov: dict[str, Any], _target: Any = impl_cls) -> object:
+                return c._construct(_target, ov)
+
+        return token, Registration(
+            factory=factory,
+            impl=impl,
+            lifetime=lifetime,
+            is_singleton=lifetime is Lifetime.SINGLETON,
+            create=create,
+        )
 
     def register_instance(
         self,
@@ -129,21 +429,51 @@ class Container:
         replace: bool = False,
     ) -> None:
         """Register a pre-built instance (always singleton)."""
-        if inspect.isclass(token):
+        if isinstance(token, type):
             # Non-type tokens (like strings): cannot validate statically.
-            self._validate_impl(cls=token, impl=type(instance))
+            # Replacing with an instance of the same type skips re-validation:
+            # that type was already accepted for this token.
+            prior = self._lookup(token) if replace else None
+            if prior is None or type(prior.cached_instance) is not type(instance):
+                self._validate_impl(cls=token, impl=type(instance))
+
+        if type(token) is str:
+            token = sys.intern(token)
 
         # Registration
         with self._lock:
-            if not replace and token in self._registrations:
+            if not replace and self._lookup(token) is not None:
                 msg = f"Token {token!r} is already registered. Pass replace=True to overwrite."
                 raise KeyError(msg)
-            self._registrations[token] = Registration(
-                factory=None,
-                impl=None,
-                lifetime=Lifetime.SINGLETON,
-                cached_instance=instance,
+            self._store(
+                token,
+                Registration(
+                    cached_instance=instance,
+                    is_cached_singleton=True,
+                    lifetime=Lifetime.SINGLETON,
+                ),
             )
+            self._singletons[token] = instance
+            self._invalidate_descendants()
+
+    def _invalidate_descendants(self) -> None:
+        # A new registration here may shadow what descendant scopes cached as
+        # the owning container for a token; drop those caches wholesale.
+        for child in self._children:
+            child._owner_cache.clear()  # noqa: SLF001
+            child._invalidate_descendants()  # noqa: SLF001
+
+    def _lookup(self, token: Any) -> Registration | None:
+        if type(token) is str:
+            return self._by_name.get(token)
+        return self._by_type.get(token)
+
+    def _store(self, token: Any, reg: Registration) -> None:
+        # Callers intern string tokens before storing.
+        if type(token) is str:
+            self._by_name[token] = reg
+        else:
+            self._by_type[token] = reg
 
     @overload
     def resolve(self, token: type[T], **overrides: Any) -> T: ...
@@ -158,29 +488,32 @@ class Container:
         - If no registration and token is a concrete class: attempt auto-wiring by type hints.
         `overrides` lets you explicitly supply constructor args.
         """
-        with self._lock:
-            reg = self._registrations.get(token)
+        # Lock-free fast path: dict reads are atomic under the GIL, and a cached
+        # singleton was already validated when it was first stored.
+        instance = self._singletons.get(token, _MISS)
+        if instance is not _MISS:
+            return instance
 
-            # Return cached singleton if present
-            if reg and reg.lifetime == Lifetime.SINGLETON and reg.cached_instance is not None:
-                return reg.cached_instance
+        reg = self._lookup(token)
 
-            # Build instance either via factory or constructor
-            if reg and reg.factory:
-                instance = reg.factory(self, **overrides)
-            else:
-                if reg and reg.impl:
-                    instance = self._construct(reg.impl, **overrides)
-                else:
-                    if inspect.isclass(token):
-                        # If no registration found and token is a class type, try auto-wiring
-                        instance = self._construct(token, **overrides)
-                    else:
-                        msg = f"No registration found for token: {token!r}"
-                        raise KeyError(msg)
-
-            if inspect.isclass(token):
-                if self._is_protocol(token):
+        # Build the instance via the registration's pre-bound create callable.
+        # No lock held here: recursive resolves (via resolve_param) must not
+        # re-enter it.
+        if reg is not None and reg.create is not None:
+            instance = reg.create(self, overrides)
+        elif isinstance(token, type):
+            # If no registration found and token is a class type, try auto-wiring
+            instance = self._construct(token, overrides)
+        else:
+            msg = f"No registration found for token: {token!r}"
+            raise KeyError(msg)
+
+        if isinstance(token, type):
+            if self._is_protocol(token):
+                # Instances of a registered impl were structurally validated at
+                # register time; only other shapes (factory results) need the
+                # structural check here.
+                if reg is None or type(instance) is not reg.impl:
                     try:
                         self._validate_protocol_impl(proto_cls=token, impl=type(instance))
                     except TypeError as e:
@@ -189,104 +522,115 @@ class Container:
                         )
                         raise TypeError(msg) from e
 
-                    if self._is_runtime_checkable_protocol(token) and not isinstance(instance, token):
-                        # can use 'isinstance' with runtime checkable protocols
-                        msg = f"Resolved instance {type(instance).__name__} does not implement runtime protocol {token.__name__}"
-                        raise TypeError(msg)
+                if self._is_runtime_checkable_protocol(token) and not _runtime_isinstance(instance, token):
+                    # can use 'isinstance' with runtime checkable protocols
+                    msg = f"Resolved instance {type(instance).__name__} does not implement runtime protocol {token.__name__}"
+                    raise TypeError(msg)
 
-                else:
-                    if reg and reg.factory:
-                        # factory path; can use isinstance with non-protocol tokens
-                        if not isinstance(instance, token):
-                            msg = f"Resolved instance {type(instance).__name__} is not an instance of {token.__name__}"
-                            raise TypeError(msg)
-                    elif reg and reg.impl:
-                        # impl path was validated with issubclass at register time,
-                        # and auto-wiring constructs the token class itself.
-                        pass
-
-            # Cache if singleton
-            if reg and reg.lifetime == Lifetime.SINGLETON:
+            else:
+                if reg and reg.factory:
+                    # factory path; can use isinstance with non-protocol tokens
+                    if not isinstance(instance, token):
+                        msg = f"Resolved instance {type(instance).__name__} is not an instance of {token.__name__}"
+                        raise TypeError(msg)
+                elif reg and reg.impl:
+                    # impl path was validated with issubclass at register time,
+                    # and auto-wiring constructs the token class itself.
+                    pass
+
+        # Cache if singleton
+        if reg is not None and reg.is_singleton:
+            with self._lock:
+                if reg.is_cached_singleton:
+                    # Another thread cached first; keep singleton identity stable.
+                    return reg.cached_instance
                 reg.cached_instance = instance
+                reg.is_cached_singleton = True
+                self._singletons[token] = instance
 
-            return instance
+        return instance
 
-    def _construct(self, cls: type[T], **overrides: Any) -> T:
-        return Constructor(self).construct(cls, **overrides)
-
-    def resolve_param(
-        self,
-        cls: type[T],
-        name: str,
-        p: inspect.Parameter,
-        bound: inspect.BoundArguments,
-        hints: dict[str, Any],
-    ) -> Any:
+    def resolve_param(self, pp: _ParamPlan) -> Any:
         """Resolving param.
 
-        Resolution precedence:
-        1. explicit override
-        2. type-based registration
-        3. name-based registration
-        4. default
-        5. error.
+        The caller has already ruled out an explicit override for this name;
+        remaining precedence:
+        1. type-based registration
+        2. name-based registration
+        3. default
+        4. error.
         """
-        # Skip var-positional/var-keyword here; filled only by explicit extras
-        if p.kind in (inspect.Parameter.VAR_POSITIONAL, inspect.Parameter.VAR_KEYWORD):
-            return inspect.Signature.empty
-
-        # 0) already explicitly bound
-        if name in bound.arguments:
-            return bound.arguments[name]
+        name = pp.name
 
         # 1) type-based
-        ann = hints.get(name, inspect.Signature.empty)
-        if ann is not inspect.Signature.empty:
-            try_type = False
-            if ann in self._registrations or (inspect.isclass(ann) and getattr(ann, "__module__", "") != "builtins"):
-                try_type = True
-
-            if try_type:
-                try:
-                    return self.resolve(ann)
-                except KeyError:
-                    if name in self._registrations:
-                        return self.resolve(name)
+        ann = pp.ann
+        if pp.is_user_class or (ann is not _EMPTY and ann in self._by_type):
+            # Registered annotations resolve directly; unregistered non-builtin
+            # classes auto-wire, which cannot raise KeyError.
+            return self.resolve(ann)
 
         # 2) name-based
-        if name in self._registrations:
+        if name in self._by_name:
             return self.resolve(name)
 
         # 3) default
-        if p.default is not inspect.Parameter.empty:
-            return p.default
-
-        # 4) error
-        ann_repr = getattr(ann, "__name__", repr(ann)) if ann is not inspect.Signature.empty else "no-annotation"
-        msg = (
-            f"Cannot satisfy constructor parameter '{name}' for {cls.__name__}'. "
-            f"No override/registration/default found (annotation: {ann_repr})."
-        )
-        raise ResolutionError(msg)
+        if pp.default is not _EMPTY:
+            return pp.default
+
+        # 4) error (message prebuilt at plan time)
+        raise ResolutionError(pp.error)
+
+    def warm(self, *tokens: Token[Any]) -> None:
+        """Eagerly resolve the given tokens and their auto-wirable dependency chains.
+
+        Moves first-resolve costs (plan building, validation, singleton
+        construction) from request time into startup: after warming, singleton
+        chains are served entirely from the cached-instance fast path.
+        """
+        for token in tokens:
+            self.resolve(token)
+
+            reg = self._lookup(token)
+            if reg is not None:
+                # Factory registrations (impl is None) build their own
+                # dependencies; walking the token class's constructor would
+                # resolve parameters the factory never uses.
+                impl = reg.impl
+            else:
+                # No registration at all: the resolve above auto-wired.
+                impl = token if isinstance(token, type) else None
+
+            if impl is not None and "__init__" in impl.__dict__:
+                for pp in _get_plan(impl).params:
+                    if pp.is_user_class:
+                        self.warm(pp.ann)
+
+    def prewarm_all(self) -> None:
+        """Resolve every registered singleton once so future resolves hit the cache."""
+        registrations = list(self._by_type.items()) + list(self._by_name.items())
+        for token, reg in registrations:
+            if reg.is_singleton and not reg.is_cached_singleton:
+                self.warm(token)
+
+    def enable_threadsafe(self) -> None:
+        """Swap the no-op lock for a real one when the container is shared across threads."""
+        if self._lock is _NULL_LOCK:
+            self._lock = threading.Lock()
 
     def create_scope(self) -> Scope:
         """Create a scope that prefers its own registrations/instances, falls back to parent."""
-        return Scope(self, _from_parent=True)
+        # Scopes commonly mean per-request/per-thread use with a shared parent.
+        self.enable_threadsafe()
+        scope = Scope(self, _token=_SCOPE_TOKEN)
+        scope.enable_threadsafe()
+        return scope
 
     def _is_protocol(self, tp: type) -> bool:
         """Detect whether 'tp' is a typing.Protocol subclass (safe)."""
-        raise NotImplementedError
+        return _is_protocol(tp)
 
     def _is_runtime_checkable_protocol(self, tp: type) -> bool:
-        if not self._is_protocol(tp):
-            return False
-
-        try:
-            isinstance(None, tp)
-        except TypeError:
-            return False
-        else:
-            return True
+        return _is_runtime_checkable_protocol(tp)
 
     def _validate_impl(self, cls: type, impl: type) -> None:
         """Validate that 'impl' implements 'cls' when cls is a class/protocol.
@@ -303,7 +647,7 @@ class Container:
 
         # If token is a normal class or ABC, enforce subclassing strictly
         if not self._is_protocol(cls):
-            if not issubclass(impl, cls):
+            if not _is_subclass(impl, cls):
                 msg = f"Implementation {impl.__name__} must be a subclass of {cls.__name__}"
                 raise TypeError(msg)
             return
@@ -318,27 +662,38 @@ class Container:
         # Otherwise, check structural conformance
         self._validate_protocol_structural_conformance(proto_cls, impl)
 
-    def _validate_protocol_structural_conformance(self, proto_cls: type, impl: type) -> None:  # noqa: C901
-        """Best-effort structural conformance: presence + basic callable arity + return type checks."""
+    def _validate_protocol_structural_conformance(self, proto_cls: type, impl: type) -> None:
+        """Best-effort structural conformance: presence + basic callable arity + return type checks.
+
+        The verdict for a given (protocol, impl) pair is invariant, so it is cached
+        after the first check; subsequent calls return (or re-raise) in one probe.
+        """
+        per_proto = _STRUCTURAL_CACHE.get(proto_cls)
+        if per_proto is None:
+            per_proto = _STRUCTURAL_CACHE[proto_cls] = WeakKeyDictionary()
+        elif impl in per_proto:
+            cached = per_proto[impl]
+            if cached is None:
+                return
+            raise TypeError(*cached.args)
+
+        try:
+            self._check_structural_conformance(proto_cls, impl)
+        except TypeError as e:
+            per_proto[impl] = e
+            raise
+        per_proto[impl] = None
+
+    def _check_structural_conformance(self, proto_cls: type, impl: type) -> None:  # noqa: C901
         missing: list[str] = []
         signature_mismatches: list[str] = []
 
-        try:
-            proto_hints = get_type_hints(proto_cls, include_extras=True)
-        except TypeError:
-            proto_hints = {}
+        proto_sigs, proto_arities, annotation_members = _get_proto_methods(proto_cls)
 
         # Attributes required by annotations
-        for name in proto_hints:
-            if name.startswith("_"):
-                continue
-            if not hasattr(impl, name):
-                missing.append(name)
-
-        for name, proto_attr in proto_cls.__dict__.items():
-            if name.startswith("_") or not inspect.isfunction(proto_attr):
-                continue
+        missing.extend(name for name in annotation_members if not hasattr(impl, name))
 
+        for name, proto_sig in proto_sigs.items():
             if not hasattr(impl, name):
                 missing.append(name)
                 continue
@@ -348,39 +703,34 @@ class Container:
                 signature_mismatches.append(f"{name}: not Callable on {impl.__name__}")
                 continue
 
+            if isinstance(proto_sig, Exception):
+                signature_mismatches.append(f"{name}: unable to compare signatures ({proto_sig})")
+                continue
+
             try:
-                proto_sig = inspect.signature(proto_attr)
-                impl_sig = inspect.signature(impl_attr)
-
-                proto_params = [p for p in proto_sig.parameters.values() if p.name != "self"]
-                impl_params = [p for p in impl_sig.parameters.values() if p.name != "self"]
-
-                def positional_arity(params: list[inspect.Parameter]) -> int:
-                    return sum(
-                        1
-                        for p in params
-                        if p.kind
-                        in (
-                            inspect.Parameter.POSITIONAL_ONLY,
-                            inspect.Parameter.POSITIONAL_OR_KEYWORD,
-                        )
-                        and p.default is inspect.Parameter.empty
-                    )
+                shape = _impl_callable_shape(impl_attr)
+                if shape is not None:
+                    impl_arity, impl_ret = shape
+                else:
+                    impl_sig = inspect.signature(impl_attr)
+                    impl_params = [p for p in impl_sig.parameters.values() if p.name != "self"]
+                    impl_arity = _positional_arity(impl_params)
+                    impl_ret = impl_sig.return_annotation
 
-                if positional_arity(impl_params) < positional_arity(proto_params):
+                proto_arity = proto_arities[name]
+                if impl_arity < proto_arity:
                     signature_mismatches.append(
                         f"{name}: impl has fewer required positional params "
-                        f"({positional_arity(impl_params)}) than protocol "
-                        f"({positional_arity(proto_params)})"
+                        f"({impl_arity}) than protocol "
+                        f"({proto_arity})"
                     )
 
                 # --- NEW: return annotation validation ---
                 proto_ret = proto_sig.return_annotation
-                impl_ret = impl_sig.return_annotation
 
                 if (
-                    proto_ret is not inspect.Signature.empty
-                    and impl_ret is not inspect.Signature.empty
+                    proto_ret is not _EMPTY
+                    and impl_ret is not _EMPTY
                     and proto_ret is not Any
                     and impl_ret is not Any
                 ):
@@ -426,12 +776,18 @@ class Scope(Container):
     Useful for per-request/per-test lifetimes without altering root registrations.
     """
 
-    def __init__(self, parent: Container, *, _from_parent: bool = False) -> None:
-        if not _from_parent:
+    __slots__ = ("_owner_cache", "_parent")
+
+    def __init__(self, parent: Container, *, _token: object | None = None) -> None:
+        if _token is not _SCOPE_TOKEN:
             msg = "Scope instances must be created via Container.create_scope()"
             raise RuntimeError(msg)
         super().__init__()
         self._parent = parent
+        # Flattened chain: token -> the ancestor container owning it, learned on
+        # first miss so later fallbacks skip the intermediate scope frames.
+        self._owner_cache: dict[Any, Container] = {}
+        parent._children.add(self)  # noqa: SLF001
 
     @overload
     def resolve(self, token: type[T], **overrides: Any) -> T: ...
@@ -445,126 +801,437 @@ class Scope(Container):
         Resolves the token using registrations in this scope. If the token is not
         registered locally, resolution falls back to the parent container.
         """
-        with self._lock:
-            reg = self._registrations.get(token)
+        # Same lock-free fast path as Container.resolve: local miss delegates to
+        # the parent (which probes its own singleton cache), a cached local
+        # singleton returns immediately.
+        instance = self._singletons.get(token, _MISS)
+        if instance is not _MISS:
+            return instance
+
+        if self._lookup(token) is None:
+            # Flattened chain: find the ancestor owning the token once, then go
+            # straight there — no per-level resolve frames on later calls.
+            owner = self._owner_cache.get(token)
+            if owner is None:
+                owner = self._parent
+                while type(owner) is Scope and owner._lookup(token) is None:  # noqa: SLF001
+                    owner = owner._parent  # noqa: SLF001
+                self._owner_cache[token] = owner
+            # Probe the owner's singleton cache directly before paying for a
+            # full resolve call.
+            instance = owner._singletons.get(token, _MISS)  # noqa: SLF001
+            if instance is not _MISS:
+                return instance
+            return owner.resolve(token, **overrides)
+
+        return super().resolve(token, **overrides)
+
+
+# Materialization instructions: how each parameter travels into the final call.
+_OP_POS_ONLY = 0
+_OP_VAR_POS = 1
+_OP_KEYWORD = 2
+_OP_VAR_KW = 3
+
+
+@dataclass(slots=True)
+class _ParamPlan:
+    """Plan-time constants for one constructor parameter."""
+
+    name: str
+    ann: Any  # type hint, or _EMPTY
+    is_user_class: bool  # non-builtin class annotation: eligible for auto-wiring
+    default: Any  # _EMPTY when required
+    error: str  # prebuilt unsatisfied-parameter message; the raise site only raises
+
+
+@dataclass(slots=True)
+class _Plan:
+    """Precomputed constructor metadata for one class, built once and reused."""
+
+    params: tuple[_ParamPlan, ...]  # non-variadic params, in declaration order
+    pos_only: frozenset[str]
+    kw_names: frozenset[str]  # names bindable by keyword
+    var_kw: str | None  # name of the **kwargs slot, if any
+    ops: tuple[tuple[int, str], ...]
+    is_trivial: bool  # no non-variadic params: bare `cls()` is always correct
+    call_bare: bool = False  # class has no __init__ of its own: always call `cls()`
+    build: Callable[[Container, dict[str, Any]], Any] | None = None  # generated fast resolver
+
+
+# Weak keys: classes defined in short-lived scopes (tests, plugins) drop their
+# plans when collected instead of being pinned by the cache.
+_PLAN_CACHE: WeakKeyDictionary[type, _Plan] = WeakKeyDictionary()
+
+# Parameter kind tags shared by the __code__ fast path and the signature fallback.
+_KIND_POS_ONLY = inspect.Parameter.POSITIONAL_ONLY
+_KIND_VAR_POS = inspect.Parameter.VAR_POSITIONAL
+_KIND_KW_ONLY = inspect.Parameter.KEYWORD_ONLY
+_KIND_VAR_KW = inspect.Parameter.VAR_KEYWORD
+_KIND_POS_OR_KW = inspect.Parameter.POSITIONAL_OR_KEYWORD
+
+
+def _params_from_code(init: FunctionType) -> list[tuple[str, Any, Any]]:
+    """Read (name, kind, default) triples straight off the code object.
+
+    Equivalent to inspect.signature for plain Python functions, minus the
+    Signature/Parameter object graph it would build per class.
+    """
+    code = init.__code__
+    names = code.co_varnames
+    n_pos = code.co_argcount
+    n_kwonly = code.co_kwonlyargcount
+    defaults = init.__defaults__ or ()
+    kwdefaults = init.__kwdefaults__ or {}
+    first_default = n_pos - len(defaults)
+
+    params: list[tuple[str, Any, Any]] = [
+        (
+            names[i],
+            _KIND_POS_ONLY if i < code.co_posonlyargcount else _KIND_POS_OR_KW,
+            defaults[i - first_default] if i >= first_default else _EMPTY,
+        )
+        for i in range(1, n_pos)  # index 0 is 'self'
+    ]
+    params.extend(
+        (names[i], _KIND_KW_ONLY, kwdefaults.get(names[i], _EMPTY)) for i in range(n_pos, n_pos + n_kwonly)
+    )
+
+    # Variadic slots live after the keyword-only names in co_varnames.
+    i = n_pos + n_kwonly
+    if code.co_flags & inspect.CO_VARARGS:
+        params.append((names[i], _KIND_VAR_POS, _EMPTY))
+        i += 1
+    if code.co_flags & inspect.CO_VARKEYWORDS:
+        params.append((names[i], _KIND_VAR_KW, _EMPTY))
+    return params
+
+
+def _params_from_signature(cls: type) -> list[tuple[str, Any, Any]]:
+    try:
+        # Notably cheaper than inspect.signature(cls), which runs extra
+        # class-handling heuristics (__new__, wrapper unwrapping); the first
+        # parameter is always 'self' and is dropped. getattr_static pulls the
+        # function off the MRO without descriptor binding.
+        init = inspect.getattr_static(cls, "__init__")
+        parameters = list(inspect.signature(init).parameters.items())[1:]
+    except (ValueError, TypeError):
+        parameters = list(inspect.signature(cls).parameters.items())
+    return [(name, p.kind, p.default) for name, p in parameters]
+
+
+def _init_annotations(cls: type, init: FunctionType) -> dict[str, Any]:
+    anns = getattr(init, "__annotations__", None) or {}
+    for ann in anns.values():
+        # Stringified (or Annotated) hints need the full get_type_hints
+        # treatment, including its all-or-nothing forward-ref handling.
+        if type(ann) is str or hasattr(ann, "__metadata__"):
+            return _get_init_type_hints(cls)
+    return anns
+
+
+def _build_plan(cls: type) -> _Plan:
+    if "__init__" not in cls.__dict__:
+        # No constructor of its own: any inherited signature is ignored and the
+        # class is instantiated bare, so the plan carries no parameters.
+        return _Plan(
+            params=(),
+            pos_only=frozenset(),
+            kw_names=frozenset(),
+            var_kw=None,
+            ops=(),
+            is_trivial=True,
+            call_bare=True,
+        )
+
+    init = cls.__dict__["__init__"]
+    if type(init) is FunctionType and not hasattr(init, "__wrapped__"):
+        parameters = _params_from_code(init)
+        hints = _init_annotations(cls, init)
+    else:
+        # Wrapped inits (functools.wraps) carry the wrapper's (*args, **kwargs)
+        # code object; inspect.signature follows __wrapped__ to the real one.
+        parameters = _params_from_signature(cls)
+        hints = _get_init_type_hints(cls)
+
+    empty = _EMPTY
+
+    params: list[_ParamPlan] = []
+    pos_only: set[str] = set()
+    kw_names: set[str] = set()
+    kw_only: set[str] = set()
+    var_kw: str | None = None
+
+    def param_plan(name: str, default: Any) -> _ParamPlan:
+        ann = hints.get(name, empty)
+        ann_repr = getattr(ann, "__name__", repr(ann)) if ann is not empty else "no-annotation"
+        return _ParamPlan(
+            name=name,
+            ann=ann,
+            is_user_class=ann is not empty and inspect.isclass(ann) and ann.__module__ != "builtins",
+            default=default,
+            error=(
+                f"Cannot satisfy constructor parameter '{name}' for {cls.__name__}'. "
+                f"No override/registration/default found (annotation: {ann_repr})."
+            ),
+        )
+    # Grouped so a single traversal reproduces the call layout:
+    # positional-only, *args, keywords, **kwargs.
+    ops_pos: list[tuple[int, str]] = []
+    ops_var_pos: list[tuple[int, str]] = []
+    ops_kw: list[tuple[int, str]] = []
+    ops_var_kw: list[tuple[int, str]] = []
+
+    for name, kind, default in parameters:
+        # Interned names make the downstream dict probes (overrides, arguments,
+        # name-based registry) hit CPython's pointer-identity fast path.
+        name = sys.intern(name)
+        if kind is _KIND_POS_ONLY:
+            pos_only.add(name)
+            ops_pos.append((_OP_POS_ONLY, name))
+            params.append(param_plan(name, default))
+        elif kind is _KIND_VAR_POS:
+            ops_var_pos.append((_OP_VAR_POS, name))
+        elif kind is _KIND_VAR_KW:
+            var_kw = name
+            ops_var_kw.append((_OP_VAR_KW, name))
+        else:
+            kw_names.add(name)
+            if kind is _KIND_KW_ONLY:
+                kw_only.add(name)
+            ops_kw.append((_OP_KEYWORD, name))
+            params.append(param_plan(name, default))
+
+    plan = _Plan(
+        params=tuple(params),
+        pos_only=frozenset(pos_only),
+        kw_names=frozenset(kw_names),
+        var_kw=var_kw,
+        ops=tuple(ops_pos + ops_var_pos + ops_kw + ops_var_kw),
+        is_trivial=not params,
+    )
+
+    # Fixed-arity constructors get a generated resolver; variadic shapes keep
+    # the interpreted path.
+    if not ops_var_pos and var_kw is None and params:
+        plan.build = _compile_build(cls, plan.params, frozenset(kw_only))
+
+    return plan
+
+
+def _compile_build(
+    cls: type, params: tuple[_ParamPlan, ...], kw_only: frozenset[str]
+) -> Callable[[Container, dict[str, Any]], Any]:
+    """Generate a per-class resolver with the precedence chain inlined per parameter.
+
+    The emitted function mirrors resolve_param exactly: override, then
+    type-based registration/auto-wiring, then name-based registration, then
+    default, then ResolutionError — but with each branch specialized at
+    plan-build time on the parameter's annotation and default.
+    """
+    empty = _EMPTY
+    # The class is held through a weakref: the plan is cached under the class as
+    # a weak key, and a strong _cls here would keep that key alive forever.
+    ns: dict[str, Any] = {"_cls_ref": ref(cls), "ResolutionError": ResolutionError}
+    src = ["def _build(container, overrides):", "    _cls = _cls_ref()"]
+
+    for i, pp in enumerate(params):
+        name, ann = pp.name, pp.ann
+        src += [f"    if {name!r} in overrides:", f"        _v{i} = overrides[{name!r}]"]
+
+        if pp.is_user_class:
+            # Non-builtin class annotation: resolve always handles it
+            # (registered or auto-wired), so no further fallbacks apply.
+            ns[f"_ann{i}"] = ann
+            src += ["    else:", f"        _v{i} = container.resolve(_ann{i})"]
+            continue
+
+        if ann is not empty:
+            ns[f"_ann{i}"] = ann
+            src += [f"    elif _ann{i} in container._by_type:", f"        _v{i} = container.resolve(_ann{i})"]
+        src += [f"    elif {name!r} in container._by_name:", f"        _v{i} = container.resolve({name!r})"]
+
+        if pp.default is not _EMPTY:
+            ns[f"_def{i}"] = pp.default
+            src += ["    else:", f"        _v{i} = _def{i}"]
+        else:
+            ns[f"_err{i}"] = pp.error
+            src += ["    else:", f"        raise ResolutionError(_err{i})"]
+
+    # Everything that may be passed positionally is (declaration order makes
+    # this valid), avoiding the kwargs-dict build in the emitted CALL; only
+    # keyword-only parameters keep the name=value form.
+    parts = [f"_v{i}" if pp.name not in kw_only else f"{pp.name}=_v{i}" for i, pp in enumerate(params)]
+    src.append(f"    return _cls({', '.join(parts)})")
+
+    exec("\n".join(src), ns)  # noqa: S102
+    return cast("Callable[[Container, dict[str, Any]], Any]", ns["_build"])
 
-            if not reg:
-                # Fallback to parent
-                return self._parent.resolve(token, **overrides)
 
-            return super().resolve(token, **overrides)
+def _get_plan(cls: type) -> _Plan:
+    plan = _PLAN_CACHE.get(cls)
+    if plan is None:
+        plan = _PLAN_CACHE[cls] = _build_plan(cls)
+    return plan
 
 
 class Constructor:
+    __slots__ = ("_resolver",)
+
     def __init__(self, resolver: Container) -> None:
         self._resolver = resolver
 
-    def construct(self, cls: type[T], **overrides: Any) -> T:
-        if "__init__" not in cls.__dict__:
+    def construct(self, cls: type[T], overrides: dict[str, Any]) -> T:
+        # The overrides dict is taken positionally: resolve already owns a
+        # fresh dict from its **overrides boundary, and re-packing it through
+        # another ** call would copy it at every hop (usually just to discover
+        # it is empty).
+        plan = _get_plan(cls)
+
+        if plan.call_bare or (plan.is_trivial and not overrides):
             return cls()
 
-        sig = inspect.signature(cls)
-        params = sig.parameters
+        # Generated resolver covers the plain keyword case; unexpected override
+        # names (and positional-only/variadic shapes) take the interpreted path.
+        build = plan.build
+        if build is not None and (not overrides or overrides.keys() <= plan.kw_names):
+            return cast("T", build(self._resolver, overrides))
 
-        overrides = overrides or {}
         overrides.pop("self", None)  # never allow passing 'self'
 
-        kw_overrides, posonly_overrides = self._split_positional_only(overrides, params)
+        kw_overrides, posonly_overrides = self._split_positional_only(overrides, plan.pos_only)
 
-        bound = self._bind_explicit(sig, kw_overrides, cls)
+        arguments = self._bind_explicit(plan, kw_overrides, cls)
 
-        self._inject_positional_only(bound, posonly_overrides)
+        self._inject_positional_only(arguments, posonly_overrides)
 
-        self._fill_missing_arguments(cls, sig, bound)
+        self._fill_missing_arguments(plan, arguments)
 
-        args, kwargs = self._materialize_call(sig, bound)
+        args, kwargs = self._materialize_call(plan, arguments)
         return cls(*args, **kwargs)
 
-    def _materialize_call(
-        self, sig: inspect.Signature, bound: inspect.BoundArguments
-    ) -> tuple[list[Any], dict[str, Any]]:
-        params = sig.parameters
-        args, kwargs = [], {}
-
-        # positional-only
-        for name, p in params.items():
-            if p.kind is p.POSITIONAL_ONLY:
-                args.append(bound.arguments[name])
-
-        # *args
-        for name, p in params.items():
-            if p.kind is p.VAR_POSITIONAL:
-                captured = tuple(bound.arguments.get(name, ()))
-                args.extend(captured)
-                break
-
-        # keywords
-        for name, p in params.items():
-            if p.kind in (p.POSITIONAL_OR_KEYWORD, p.KEYWORD_ONLY):
-                kwargs[name] = bound.arguments[name]
-
-        # **kwargs
-        for name, p in params.items():
-            if p.kind is p.VAR_KEYWORD:
-                kwargs.update(bound.arguments.get(name, {}))
-                break
+    def _materialize_call(self, plan: _Plan, arguments: dict[str, Any]) -> tuple[list[Any], dict[str, Any]]:
+        args: list[Any] = []
+        kwargs: dict[str, Any] = {}
 
-        return args, kwargs
-
-    def _fill_missing_arguments(self, cls: type[T], sig: inspect.Signature, bound: inspect.BoundArguments) -> None:
-        hints = _get_init_type_hints(cls)
+        for op, name in plan.ops:
+            if op == _OP_KEYWORD:
+                kwargs[name] = arguments[name]
+            elif op == _OP_POS_ONLY:
+                args.append(arguments[name])
+            elif op == _OP_VAR_POS:
+                args.extend(arguments.get(name, ()))
+            else:  # _OP_VAR_KW
+                kwargs.update(arguments.get(name, {}))
 
-        for name, p in sig.parameters.items():
-            if p.kind in (p.VAR_POSITIONAL, p.VAR_KEYWORD):
-                continue
+        return args, kwargs
 
-            if name not in bound.arguments:
-                value = self._resolver.resolve_param(cls, name, p, bound, hints)
-                if value is not inspect.Signature.empty:
-                    bound.arguments[name] = value
+    def _fill_missing_arguments(self, plan: _Plan, arguments: dict[str, Any]) -> None:
+        resolve_param = self._resolver.resolve_param  # hoisted: LOAD_FAST in the loop
+        for pp in plan.params:
+            if pp.name not in arguments:
+                arguments[pp.name] = resolve_param(pp)
 
-    def _inject_positional_only(self, bound: inspect.BoundArguments, posonly_overrides: dict[str, Any]) -> None:
-        for name, value in posonly_overrides.items():
-            bound.arguments[name] = value
+    def _inject_positional_only(self, arguments: dict[str, Any], posonly_overrides: dict[str, Any]) -> None:
+        arguments.update(posonly_overrides)
 
     def _split_positional_only(
         self,
         overrides: dict[str, Any],
-        params: Mapping[str, inspect.Parameter],
+        pos_only: frozenset[str],
     ) -> tuple[dict[str, Any], dict[str, Any]]:
-        pos_only = {name for name, p in params.items() if p.kind is inspect.Parameter.POSITIONAL_ONLY}
-
+        # Mainline cases allocate nothing: both halves are read-only downstream.
+        if not overrides:
+            return _EMPTY_DICT, _EMPTY_DICT
+        if not pos_only:
+            return overrides, _EMPTY_DICT
         return (
             {k: v for k, v in overrides.items() if k not in pos_only},
             {k: v for k, v in overrides.items() if k in pos_only},
         )
 
-    def _bind_explicit(self, sig: inspect.Signature, kw: dict[str, Any], cls: type[T]) -> inspect.BoundArguments:
-        try:
-            return sig.bind_partial(**kw)
-        except TypeError as e:
-            msg = f"Overrides don't match {cls.__name__} signature: {e}"
-            raise TypeError(msg) from e
+    def _bind_explicit(self, plan: _Plan, kw: dict[str, Any], cls: type[T]) -> dict[str, Any]:
+        """Bind keyword overrides to parameter names without inspect.BoundArguments.
+
+        Unknown names fall into the **kwargs slot when one exists, mirroring
+        Signature.bind_partial; otherwise a TypeError is raised.
+        """
+        if not kw:
+            return {}
+
+        # One C-level set difference decides the common no-extras case; the
+        # split below only runs when something must be forwarded.
+        kw_names = plan.kw_names
+        if kw_names >= kw.keys():
+            return dict(kw)
+
+        if plan.var_kw is None:
+            unexpected = ", ".join(repr(name) for name in kw if name not in kw_names)
+            msg = f"Overrides don't match {cls.__name__} signature: got unexpected keyword arguments {unexpected}"
+            raise TypeError(msg)
+
+        arguments = {name: value for name, value in kw.items() if name in kw_names}
+        arguments[plan.var_kw] = {name: value for name, value in kw.items() if name not in kw_names}
+        return arguments
 
 
 if hasattr(typing, "is_protocol"):
     # https://docs.python.org/3/library/typing.html#typing.is_protocol
-    def _is_protocol_3_13(self: Any, tp: type) -> bool:
+    def _is_protocol_uncached(tp: type) -> bool:
         return inspect.isclass(tp) and typing.is_protocol(tp)
-
-    Container._is_protocol = _is_protocol_3_13  # type: ignore[method-assign] # noqa: SLF001
 else:
 
-    def _is_protocol_legacy(self: Any, tp: type) -> bool:
+    def _is_protocol_uncached(tp: type) -> bool:
         """Detect whether 'tp' is a typing.Protocol subclass (safe)."""
-        return inspect.isclass(tp) and issubclass(tp, cast("type", Protocol))
+        return inspect.isclass(tp) and issubclass(tp, _PROTOCOL_BASE)
+
+
+# Both properties are invariant for a given class, so one probe replaces the
+# typing/issubclass machinery on every resolve. Weak keys (rather than
+# lru_cache, which holds strong references) keep classes collectable.
+_PROTOCOL_FLAGS: WeakKeyDictionary[type, tuple[bool, bool]] = WeakKeyDictionary()
+
+
+def _protocol_flags(tp: type) -> tuple[bool, bool]:
+    flags = _PROTOCOL_FLAGS.get(tp)
+    if flags is None:
+        is_proto = _is_protocol_uncached(tp)
+        runtime = False
+        if is_proto:
+            try:
+                isinstance(None, tp)
+            except TypeError:
+                runtime = False
+            else:
+                runtime = True
+        flags = _PROTOCOL_FLAGS[tp] = (is_proto, runtime)
+    return flags
+
+
+def _is_protocol(tp: type) -> bool:
+    return _protocol_flags(tp)[0]
+
 
-    Container._is_protocol = _is_protocol_legacy  # type: ignore[method-assign] # noqa: SLF001
+def _is_runtime_checkable_protocol(tp: type) -> bool:
+    return _protocol_flags(tp)[1]
+
+
+# Hints keyed by id of the __init__ function so classes sharing an inherited
+# __init__ reuse one get_type_hints result; a finalizer evicts dead entries.
+_HINTS_CACHE: dict[int, dict[str, Any]] = {}
 
 
 def _get_init_type_hints(cls: type[T]) -> dict[str, Any]:
     try:
         init = inspect.getattr_static(cls, "__init__")
+    except TypeError:
+        return {}
+
+    cached = _HINTS_CACHE.get(id(init))
+    if cached is not None:
+        return cached
+
+    try:
         hints = get_type_hints(init)
     except TypeError:
         hints = {}
@@ -572,4 +1239,12 @@ def _get_init_type_hints(cls: type[T]) -> dict[str, Any]:
         logger.warning("'%s' name error retrieving %s (%s) type hints", exc.name, cls.__name__, cls.__qualname__)
         hints = {}
 
+    try:
+        finalize(init, _HINTS_CACHE.pop, id(init), None)
+    except TypeError:
+        # Not weak-referenceable (e.g. object.__init__'s slot wrapper): id could
+        # be reused after collection, so don't cache.
+        return hints
+
+    _HINTS_CACHE[id(init)] = hints
     return hints
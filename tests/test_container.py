@@ -1,3 +1,4 @@
+import functools
 from typing import Protocol, runtime_checkable
 
 import pytest
@@ -414,3 +415,70 @@ def test_resolve_raises_recursion_error_with_circular_references():
     with pytest.raises(RecursionError):
         c.resolve(Service)
 
+
+
+def test_register_many_matches_individual_register_calls():
+    class DB: ...
+
+    class Repo:
+        def __init__(self, db: DB):
+            self.db = db
+
+    batch = Container()
+    batch.register_many([
+        (DB, {"impl": DB}),
+        (Repo, {"impl": Repo}),
+        ("marker", {"factory": lambda _: "ready", "lifetime": Lifetime.TRANSIENT}),
+    ])
+
+    one_by_one = Container()
+    one_by_one.register(DB, impl=DB)
+    one_by_one.register(Repo, impl=Repo)
+    one_by_one.register("marker", factory=lambda _: "ready", lifetime=Lifetime.TRANSIENT)
+
+    for c in (batch, one_by_one):
+        repo = c.resolve(Repo)
+        assert isinstance(repo.db, DB)
+        assert repo.db is c.resolve(DB), "default lifetime is SINGLETON"
+        assert c.resolve("marker") == "ready"
+
+
+def test_register_many_rejects_impl_and_factory_in_one_spec():
+    c = Container()
+
+    class A: ...
+
+    with pytest.raises(ValueError, match="not both"):
+        c.register_many([(A, {"impl": A, "factory": lambda _: A()})])
+
+
+def test_register_many_rejects_unknown_spec_keys():
+    c = Container()
+
+    class A: ...
+
+    with pytest.raises(ValueError, match="liftime"):
+        c.register_many([(A, {"impl": A, "liftime": Lifetime.TRANSIENT})])
+
+
+def test_resolve_autowires_class_with_wraps_decorated_init():
+    c = Container()
+
+    class DB: ...
+
+    def logged(fn):
+        @functools.wraps(fn)
+        def wrapper(*args, **kwargs):
+            return fn(*args, **kwargs)
+
+        return wrapper
+
+    class Service:
+        @logged
+        def __init__(self, db: DB):
+            self.db = db
+
+    svc = c.resolve(Service)
+    assert isinstance(svc.db, DB)
+    # Resolve again to exercise the cached plan.
+    assert isinstance(c.resolve(Service).db, DB)
@@ -34,3 +34,90 @@ class TestLifetimeControl(unittest.TestCase):
         b = self.cont.resolve(A)
         assert a is inst
         assert b is inst
+
+
+class TestWarmup(unittest.TestCase):
+    cont: Container
+
+    def setUp(self):
+        self.cont = Container()
+
+    def test_warm_populates_singleton_fast_path(self):
+        class A: ...
+
+        self.cont.register(A, impl=A, lifetime=Lifetime.SINGLETON)
+        self.cont.warm(A)
+        assert A in self.cont._singletons  # noqa: SLF001
+        assert self.cont.resolve(A) is self.cont._singletons[A]  # noqa: SLF001
+
+    def test_warm_resolves_transitive_chain_once(self):
+        calls: list[str] = []
+
+        class A:
+            def __init__(self):
+                calls.append("A")
+
+        class B:
+            def __init__(self, a: A):
+                calls.append("B")
+                self.a = a
+
+        self.cont.register(A, impl=A, lifetime=Lifetime.SINGLETON)
+        self.cont.register(B, impl=B, lifetime=Lifetime.SINGLETON)
+
+        self.cont.warm(B)
+        assert calls == ["A", "B"], "warming should construct each singleton exactly once"
+
+        b = self.cont.resolve(B)
+        assert b is self.cont.resolve(B)
+        assert b.a is self.cont.resolve(A), "the warmed dependency is the cached singleton"
+        assert calls == ["A", "B"], "resolves after warming must hit the cache"
+
+    def test_prewarm_all_caches_every_registered_singleton(self):
+        class A: ...
+
+        class B: ...
+
+        class C: ...
+
+        self.cont.register(A, impl=A, lifetime=Lifetime.SINGLETON)
+        self.cont.register("b", impl=B, lifetime=Lifetime.SINGLETON)
+        self.cont.register(C, impl=C, lifetime=Lifetime.TRANSIENT)
+
+        self.cont.prewarm_all()
+        assert A in self.cont._singletons  # noqa: SLF001
+        assert "b" in self.cont._singletons  # noqa: SLF001
+        assert C not in self.cont._singletons, "transients are never cached"  # noqa: SLF001
+
+    def test_warm_factory_registration_does_not_walk_the_token_constructor(self):
+        class Dep:
+            def __init__(self, name: str):
+                self.name = name
+
+        class Svc:
+            def __init__(self, dep: Dep):
+                self.dep = dep
+
+        # The factory satisfies Dep itself; Dep's bare-str parameter must not
+        # be resolved during warmup.
+        self.cont.register(Svc, factory=lambda _: Svc(Dep("x")))
+
+        self.cont.warm(Svc)
+        assert Svc in self.cont._singletons  # noqa: SLF001
+
+        svc = self.cont.resolve(Svc)
+        assert svc is self.cont.resolve(Svc)
+        assert svc.dep.name == "x"
+
+    def test_prewarm_all_works_with_factory_registrations(self):
+        class Dep:
+            def __init__(self, name: str):
+                self.name = name
+
+        class Svc:
+            def __init__(self, dep: Dep):
+                self.dep = dep
+
+        self.cont.register(Svc, factory=lambda _: Svc(Dep("x")))
+        self.cont.prewarm_all()
+        assert Svc in self.cont._singletons  # noqa: SLF001
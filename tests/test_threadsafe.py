@@ -0,0 +1,76 @@
+import threading
+import unittest
+
+from litebind import Container, Lifetime
+from litebind._container import _NULL_LOCK
+
+
+class TestThreadSafety(unittest.TestCase):
+    cont: Container
+
+    def setUp(self):
+        self.cont = Container()
+
+    def test_container_starts_with_noop_lock(self):
+        assert self.cont._lock is _NULL_LOCK  # noqa: SLF001
+
+    def test_enable_threadsafe_swaps_in_a_real_lock_once(self):
+        self.cont.enable_threadsafe()
+        lock = self.cont._lock  # noqa: SLF001
+        assert lock is not _NULL_LOCK
+
+        # A second call must not replace a lock that may already be in use.
+        self.cont.enable_threadsafe()
+        assert self.cont._lock is lock  # noqa: SLF001
+
+    def test_create_scope_enables_threadsafe_on_parent_and_scope(self):
+        scope = self.cont.create_scope()
+        assert self.cont._lock is not _NULL_LOCK  # noqa: SLF001
+        assert scope._lock is not _NULL_LOCK  # noqa: SLF001
+
+    def test_concurrent_resolves_share_one_singleton(self):
+        class Service: ...
+
+        self.cont.register(Service, impl=Service, lifetime=Lifetime.SINGLETON)
+        self.cont.enable_threadsafe()
+
+        n_threads = 8
+        barrier = threading.Barrier(n_threads)
+        results: list[Service] = []
+
+        def worker():
+            barrier.wait()
+            results.append(self.cont.resolve(Service))
+
+        threads = [threading.Thread(target=worker) for _ in range(n_threads)]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+
+        assert len(results) == n_threads
+        first = results[0]
+        assert all(r is first for r in results), "all threads should see the same singleton"
+
+    def test_concurrent_resolves_in_scope_share_one_singleton(self):
+        class Service: ...
+
+        scope = self.cont.create_scope()
+        scope.register(Service, impl=Service, lifetime=Lifetime.SINGLETON)
+
+        n_threads = 8
+        barrier = threading.Barrier(n_threads)
+        results: list[Service] = []
+
+        def worker():
+            barrier.wait()
+            results.append(scope.resolve(Service))
+
+        threads = [threading.Thread(target=worker) for _ in range(n_threads)]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+
+        first = results[0]
+        assert all(r is first for r in results), "scoped singleton identity must hold across threads"
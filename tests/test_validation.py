@@ -1,5 +1,7 @@
+import functools
 import unittest
 from typing import Protocol, runtime_checkable
+from unittest import mock
 
 import pytest
 
@@ -206,3 +208,80 @@ class TestRegisterInstanceReplacement(unittest.TestCase):
 
         obj = c.resolve(A)
         assert obj == a2
+
+
+class TestRegisterInstanceReplaceValidation(unittest.TestCase):
+    cont: Container
+
+    @runtime_checkable
+    class RepoProtocol(Protocol):
+        def get(self) -> int: ...
+
+    class GoodRepo:
+        def get(self) -> int:
+            return 42
+
+    class BadRepo:
+        def other(self) -> str:
+            return "nope"
+
+    def setUp(self):
+        self.cont = Container()
+
+    def test_same_type_replace_skips_revalidation(self):
+        first = self.GoodRepo()
+        self.cont.register_instance(self.RepoProtocol, first)
+
+        replacement = self.GoodRepo()
+        with mock.patch.object(Container, "_validate_impl", autospec=True) as validate:
+            self.cont.register_instance(self.RepoProtocol, replacement, replace=True)
+        validate.assert_not_called()
+        assert self.cont.resolve(self.RepoProtocol) is replacement
+
+    def test_different_type_replace_is_still_validated(self):
+        self.cont.register_instance(self.RepoProtocol, self.GoodRepo())
+
+        with pytest.raises(TypeError):
+            self.cont.register_instance(self.RepoProtocol, self.BadRepo(), replace=True)
+
+        # The prior conforming instance is untouched by the failed replace.
+        assert isinstance(self.cont.resolve(self.RepoProtocol), self.GoodRepo)
+
+    def test_different_conforming_type_replace_succeeds(self):
+        class OtherRepo:
+            def get(self) -> int:
+                return 7
+
+        self.cont.register_instance(self.RepoProtocol, self.GoodRepo())
+        replacement = OtherRepo()
+        self.cont.register_instance(self.RepoProtocol, replacement, replace=True)
+        assert self.cont.resolve(self.RepoProtocol) is replacement
+
+
+class TestWrappedImplMethodValidation(unittest.TestCase):
+    cont: Container
+
+    @runtime_checkable
+    class RepoProtocol(Protocol):
+        def get(self, key: str) -> int: ...
+
+    def setUp(self):
+        self.cont = Container()
+
+    def test_register_accepts_conforming_impl_with_wraps_decorated_method(self):
+        def logged(fn):
+            @functools.wraps(fn)
+            def wrapper(*args, **kwargs):
+                return fn(*args, **kwargs)
+
+            return wrapper
+
+        class WrappedRepo:
+            @logged
+            def get(self, key: str) -> int:
+                return 42
+
+        # The wrapper's own code object takes (*args, **kwargs); arity must be
+        # read through __wrapped__, not off the wrapper.
+        self.cont.register(self.RepoProtocol, WrappedRepo)
+        assert self.cont.resolve(self.RepoProtocol).get("answer") == 42